@@ -1,16 +1,39 @@
-import pandas as pd
 import os
 
+if os.environ.get('USE_MODIN'):
+    # Opt-in multicore path: Modin keeps the pandas API but parallelizes
+    # the heavy read and clean steps over cores
+    import modin.pandas as pd
+else:
+    import pandas as pd
+
+def ensure_parquet(xlsx_path, parquet_path):
+    """
+    Convert the Excel workbook to Parquet once, reusing the artifact until
+    the workbook changes. Skips the slow openpyxl XML parse on repeat runs
+    and keeps dtypes stable between runs.
+    """
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(xlsx_path):
+        return parquet_path
+
+    print(f"Converting {xlsx_path} to {parquet_path}...")
+    df = pd.read_excel(xlsx_path, sheet_name="Loan Dataset")
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+    return parquet_path
+
 def load_data(file_path):
     """
-    Load Sheet 1: Loan Dataset from the Excel file.
+    Load Sheet 1: Loan Dataset, going through a cached Parquet copy.
     """
     if not os.path.exists(file_path):
         print(f"File not found: {file_path}")
         return None
-    
-    print(f"Loading data from {file_path}...")
-    df = pd.read_excel(file_path, sheet_name="Loan Dataset")
+
+    parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+    ensure_parquet(file_path, parquet_path)
+
+    print(f"Loading data from {parquet_path}...")
+    df = pd.read_parquet(parquet_path, dtype_backend="pyarrow")
     return df
 
 def clean_data(df):
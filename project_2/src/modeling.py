@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import os
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
@@ -24,13 +25,15 @@ def train_model(df, target_col='default_flag'):
     # Filter columns that exist
     feature_columns = [col for col in feature_columns if col in df.columns]
     
-    X = df[feature_columns].fillna(0) # Basic imputation
-    y = df[target_col]
-    
+    # Hand scikit-learn a C-contiguous float32 matrix upfront so fit doesn't
+    # re-copy a float64 DataFrame internally; basic imputation with fillna(0)
+    X = np.ascontiguousarray(df[feature_columns].fillna(0).to_numpy(dtype=np.float32))
+    y = df[target_col].to_numpy(dtype=np.int8)
+
     X_train, X_test, y_train, y_test = train_test_split(X, y, stratify=y, test_size=0.2, random_state=42)
-    
+
     print("Training Random Forest model...")
-    model = RandomForestClassifier(max_depth=8, n_estimators=200, random_state=42)
+    model = RandomForestClassifier(max_depth=8, n_estimators=200, random_state=42, n_jobs=-1)
     model.fit(X_train, y_train)
     
     preds_prob = model.predict_proba(X_test)[:, 1]
@@ -1,17 +1,60 @@
 import sqlite3
 import pandas as pd
+import pyarrow as pa
 import os
 
+def _arrow_to_sqlite(arrow_type):
+    """
+    Map an Arrow field type to a SQLite column type.
+    """
+    if pa.types.is_boolean(arrow_type) or pa.types.is_integer(arrow_type):
+        return "INTEGER"
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return "REAL"
+    return "TEXT"
+
 def save_to_sqlite(df, db_name="loans.db", table_name="loans"):
     """
-    Save DataFrame to a SQLite database.
+    Save DataFrame to a SQLite database in one bulk transaction.
+
+    The table schema is declared from the inferred Arrow schema (so bool/int
+    columns land as INTEGER and floats as REAL rather than TEXT) and all rows
+    go in via a single executemany inside one transaction, with WAL
+    journaling and deferred fsync, instead of to_sql's row-wise autocommit
+    inserts.
     """
     db_path = os.path.join("data", "db", db_name)
     print(f"Saving data to SQLite table '{table_name}' in {db_path}...")
-    
+
+    # SQLite can't bind Timestamps directly; store them as ISO text
+    datetime_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+    if datetime_cols:
+        df = df.copy()
+        for col in datetime_cols:
+            df[col] = df[col].astype(str)
+
     conn = sqlite3.connect(db_path)
-    df.to_sql(table_name, conn, if_exists='replace', index=False)
-    conn.close()
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        columns = ", ".join(f'"{field.name}" {_arrow_to_sqlite(field.type)}' for field in schema)
+        placeholders = ", ".join("?" * len(df.columns))
+
+        conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+        conn.execute(f'CREATE TABLE "{table_name}" ({columns})')
+        # pd.NA/NaN can't be bound by sqlite3; convert to None so
+        # missing values land as SQL NULL like to_sql did
+        rows = df.astype(object).where(df.notna(), None)
+        conn.executemany(
+            f'INSERT INTO "{table_name}" VALUES ({placeholders})',
+            rows.itertuples(index=False, name=None),
+        )
+        conn.commit()
+    finally:
+        conn.close()
     print("Data successfully saved to SQL.")
 
 def load_from_sqlite(query, db_name="loans.db"):
@@ -0,0 +1,41 @@
+"""Tests for the SQLite helpers. Run with python -m unittest."""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from sql_utils import save_to_sqlite, load_from_sqlite
+
+
+class SaveToSqliteTests(unittest.TestCase):
+    def test_missing_values_bind_as_null(self):
+        # Arrow-backed frames carry pd.NA in every nullable column; the
+        # insert must bind those as SQL NULL instead of raising
+        df = pd.DataFrame({
+            'loan_id': [1, 2, 3],
+            'issued_amount': [1000.0, None, 2500.0],
+            'customer_risk_rating': [3, 5, None],
+            'purpose': ['car', None, 'house'],
+        }).convert_dtypes(dtype_backend='pyarrow')
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'data', 'db'))
+            os.chdir(tmp)
+            try:
+                save_to_sqlite(df, db_name='test.db', table_name='loans')
+                out = load_from_sqlite('SELECT * FROM loans', db_name='test.db')
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(len(out), 3)
+        self.assertTrue(out['issued_amount'].isna().iloc[1])
+        self.assertTrue(out['customer_risk_rating'].isna().iloc[2])
+        self.assertTrue(out['purpose'].isna().iloc[1])
+        self.assertEqual(out['issued_amount'].iloc[0], 1000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
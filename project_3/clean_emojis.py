@@ -1,39 +1,87 @@
-import re
+import codecs
+import os
 import sys
+import tempfile
 
-if len(sys.argv) != 2:
-    print("Usage: python clean_emojis.py <filepath>")
-    sys.exit(1)
-
-filepath = sys.argv[1]
-
-try:
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-except FileNotFoundError:
-    print(f"Error: File '{filepath}' not found.")
-    sys.exit(1)
-
-# Regex to match emojis (covers most common ranges)
-emoji_pattern = re.compile(
-    r'[\U0001F600-\U0001F64F'  # emoticons
-    r'\U0001F300-\U0001F5FF'  # symbols & pictographs
-    r'\U0001F680-\U0001F6FF'  # transport & map symbols
-    r'\U0001F1E0-\U0001F1FF'  # flags
-    r'\U00002700-\U000027BF'  # dingbats
-    r'\U0001f926-\U0001f937'  # gestures
-    r'\U00010000-\U0010ffff'  # other misc
-    r'\u2640-\u2642'  # gender symbols
-    r'\u2600-\u2B55'  # misc symbols
-    r'\u2300-\u23FF'  # misc technical
-    r'\u200d'  # zero width joiner
-    r'\ufe0f'  # variation selector
-    r'\u3030'  # wavy dash
-    r']+', flags=re.UNICODE)
-
-cleaned = emoji_pattern.sub('', content)
-
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(cleaned)
-
-print(f"Emojis removed from '{filepath}'.")
+import numpy as np
+
+# Read the file in fixed-size chunks so peak memory stays at one buffer
+# instead of 2x the file size
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def remove_emojis(content: str) -> str:
+    """
+    Strip emoji codepoints with vectorized NumPy range comparisons.
+
+    The text is viewed as a uint32 codepoint array and a boolean keep-mask is
+    built from a handful of SIMD-friendly range checks, replacing the Python
+    regex state machine that visited every character. The ranges match the
+    old pattern: all supplementary planes plus the BMP symbol block, zero
+    width joiner, variation selector and wavy dash.
+    """
+    buf = np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32)
+    drop = (
+        (buf >= 0x10000)                       # all supplementary planes
+        | ((buf >= 0x2300) & (buf <= 0x23FF))  # miscellaneous technical
+        | ((buf >= 0x2600) & (buf <= 0x2B55))  # misc symbols through enclosed
+        | (buf == 0x200D)                      # zero width joiner
+        | (buf == 0xFE0F)                      # variation selector
+        | (buf == 0x3030)                      # wavy dash
+    )
+    if not drop.any():
+        return content
+    return buf[~drop].tobytes().decode('utf-32-le')
+
+
+def clean_file(filepath: str):
+    """
+    Stream the file through remove_emojis chunk by chunk.
+
+    Chunks are read as bytes and decoded with an incremental decoder so
+    multi-byte sequences split across chunk boundaries are handled, cleaned
+    output goes to a temp file in the same directory, and the original is
+    replaced atomically at the end.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    directory = os.path.dirname(os.path.abspath(filepath))
+
+    tmp = tempfile.NamedTemporaryFile('wb', dir=directory, delete=False)
+    try:
+        with open(filepath, 'rb') as src:
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                if text:
+                    tmp.write(remove_emojis(text).encode('utf-8'))
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            tmp.write(remove_emojis(tail).encode('utf-8'))
+        tmp.close()
+        os.replace(tmp.name, filepath)
+    except BaseException:
+        tmp.close()
+        os.unlink(tmp.name)
+        raise
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python clean_emojis.py <filepath>")
+        sys.exit(1)
+
+    filepath = sys.argv[1]
+
+    try:
+        clean_file(filepath)
+    except FileNotFoundError:
+        print(f"Error: File '{filepath}' not found.")
+        sys.exit(1)
+
+    print(f"Emojis removed from '{filepath}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -68,6 +68,16 @@ CREATE TABLE IF NOT EXISTS teams (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Daily Aggregates Table: pre-summed per-day stats for trend queries.
+-- Refreshed from the fetch pipeline so trend reads stay O(days) instead
+-- of re-scanning player_stats.
+CREATE TABLE IF NOT EXISTS player_stats_daily (
+    date TEXT PRIMARY KEY,
+    total_goals INTEGER DEFAULT 0,
+    total_assists INTEGER DEFAULT 0,
+    avg_efficiency REAL DEFAULT 0.0
+);
+
 -- Create Indexes for Performance
 CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(utc_date);
 CREATE INDEX IF NOT EXISTS idx_matches_teams ON matches(home_team_id, away_team_id);
@@ -76,6 +86,8 @@ CREATE INDEX IF NOT EXISTS idx_player_stats_match ON player_stats(match_id);
 CREATE INDEX IF NOT EXISTS idx_player_stats_player ON player_stats(player_id);
 CREATE INDEX IF NOT EXISTS idx_player_stats_team ON player_stats(team_id);
 CREATE INDEX IF NOT EXISTS idx_player_stats_created ON player_stats(created_at);
+CREATE INDEX IF NOT EXISTS idx_player_stats_player_team ON player_stats(player_name, team_name);
+CREATE INDEX IF NOT EXISTS idx_player_stats_team_name ON player_stats(team_name);
 
 -- View: Player Performance Summary
 CREATE VIEW IF NOT EXISTS player_performance_summary AS
@@ -110,6 +122,12 @@ SELECT
 FROM player_stats ps
 GROUP BY ps.team_id, ps.team_name;
 
+-- Materialized copy of team_performance_summary, refreshed from the
+-- fetch pipeline. Dashboard reads scan this small table instead of
+-- re-evaluating the aggregating view on every render.
+CREATE TABLE IF NOT EXISTS team_performance_cache AS
+SELECT * FROM team_performance_summary WHERE 0;
+
 -- View: Recent Matches
 CREATE VIEW IF NOT EXISTS recent_matches AS
 SELECT 
@@ -5,14 +5,16 @@ Interactive Streamlit dashboard for player performance tracking.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import logging
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from dotenv import load_dotenv
 
 # Add src directory to path
@@ -37,8 +39,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for professional styling
-st.markdown("""
+# Custom CSS for professional styling, built once at import so reruns
+# re-send the same interned string rather than rebuilding it
+_CUSTOM_CSS = """
     <style>
     .main {
         padding: 0rem 1rem;
@@ -69,7 +72,27 @@ st.markdown("""
         font-weight: 500;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+_FOOTER_HTML = """
+    <div style='text-align: center; color: #6b7280; padding: 20px;'>
+        <p> Real-Time Sports Analytics Dashboard | Powered by Football-Data.org API</p>
+        <p>Built with Streamlit, Plotly, and SQLite</p>
+    </div>
+"""
+
+
+def _inject_css():
+    """Inject the custom stylesheet (constant string, no per-run build)."""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@st.fragment
+def display_footer():
+    """Display the static footer as a fragment so filter interactions
+    elsewhere on the page never rerun it."""
+    st.divider()
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 @st.cache_resource
@@ -78,31 +101,86 @@ def get_db_connection():
     return get_database_manager()
 
 
-def load_data():
-    """Load data from database."""
-    db = get_db_connection()
-    
+# Explicit projections: the dashboard reads only these columns, so the
+# queries name them instead of SELECT * — SQLite decodes and pandas
+# allocates nothing the page never touches
+MATCHES_COLS = [
+    'match_id', 'utc_date', 'home_team_name', 'away_team_name',
+    'home_score', 'away_score',
+]
+PLAYER_STATS_COLS = [
+    'player_name', 'team_name', 'goals', 'assists',
+    'minutes_played', 'efficiency',
+]
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_matches(date_from=None, date_to=None):
+    """Load recent matches, date-filtered in SQL (cached across reruns)."""
+    query = f"SELECT {', '.join(MATCHES_COLS)} FROM matches"
+    conditions = []
+    params = {}
+    if date_from:
+        conditions.append("DATE(utc_date) >= :date_from")
+        params['date_from'] = str(date_from)
+    if date_to:
+        conditions.append("DATE(utc_date) <= :date_to")
+        params['date_to'] = str(date_to)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY utc_date DESC LIMIT 1000"
+    return get_db_connection().execute_query(query, params or None)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_player_stats(team_name=None, player_name=None):
+    """Load recent player stats, filtered in SQL (cached across reruns)."""
+    query = f"SELECT {', '.join(PLAYER_STATS_COLS)} FROM player_stats"
+    conditions = []
+    params = {}
+    if team_name:
+        conditions.append("team_name = :team_name")
+        params['team_name'] = team_name
+    if player_name:
+        conditions.append("player_name = :player_name")
+        params['player_name'] = player_name
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY created_at DESC LIMIT 5000"
+    stats = get_db_connection().execute_query(query, params or None)
+    # Categorical name columns: the shared groupby then compares integer
+    # codes instead of hashing Python strings row by row
+    for col in ('team_name', 'player_name'):
+        if col in stats.columns:
+            stats[col] = stats[col].astype('category')
+    return stats
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_team_performance():
+    """Load team performance summary (cached across reruns)."""
+    return get_db_connection().get_team_performance()
+
+
+def load_data(selected_team='All', selected_player='All', date_from=None, date_to=None):
+    """
+    Load data from database through the per-process data cache.
+
+    The sidebar filters travel as WHERE predicates, so no full frame is
+    loaded and re-masked in pandas. The three queries are independent and
+    WAL allows concurrent readers, so they run in parallel and the load
+    costs roughly the slowest query rather than the sum of all three.
+    """
     try:
-        # Load matches
-        matches_query = """
-            SELECT * FROM matches 
-            ORDER BY utc_date DESC 
-            LIMIT 1000
-        """
-        matches = db.execute_query(matches_query)
-        
-        # Load player stats
-        stats_query = """
-            SELECT * FROM player_stats 
-            ORDER BY created_at DESC 
-            LIMIT 5000
-        """
-        player_stats = db.execute_query(stats_query)
-        
-        # Load team performance
-        team_performance = db.get_team_performance()
-        
-        return matches, player_stats, team_performance
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            matches_f = ex.submit(_load_matches, date_from, date_to)
+            stats_f = ex.submit(
+                _load_player_stats,
+                None if selected_team == 'All' else selected_team,
+                None if selected_player == 'All' else selected_player,
+            )
+            teams_f = ex.submit(_load_team_performance)
+            return matches_f.result(), stats_f.result(), teams_f.result()
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
@@ -118,16 +196,28 @@ def display_header():
     
     with col2:
         if st.button("Refresh Data", use_container_width=True):
-            st.cache_resource.clear()
+            st.cache_data.clear()
             st.rerun()
 
 
-def display_kpis(player_stats, matches):
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_kpi_summary(selected_team, selected_player):
+    """Load KPI totals, aggregated in SQL (cached across reruns)."""
+    return get_db_connection().get_kpi_summary(
+        team_name=None if selected_team == 'All' else selected_team,
+        player_name=None if selected_player == 'All' else selected_player
+    )
+
+
+@st.fragment
+def display_kpis(matches, selected_team='All', selected_player='All'):
     """Display key performance indicators."""
     st.subheader(" Key Performance Indicators")
-    
+
+    kpis = _load_kpi_summary(selected_team, selected_player)
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         total_matches = len(matches) if not matches.empty else 0
         st.metric(
@@ -135,54 +225,62 @@ def display_kpis(player_stats, matches):
             value=f"{total_matches:,}",
             delta=None
         )
-    
+
     with col2:
-        total_goals = int(player_stats['goals'].sum()) if not player_stats.empty else 0
         st.metric(
             label="Total Goals",
-            value=f"{total_goals:,}",
+            value=f"{int(kpis['total_goals']):,}",
             delta=None
         )
-    
+
     with col3:
-        total_assists = int(player_stats['assists'].sum()) if not player_stats.empty else 0
         st.metric(
             label="Total Assists",
-            value=f"{total_assists:,}",
+            value=f"{int(kpis['total_assists']):,}",
             delta=None
         )
-    
+
     with col4:
-        avg_efficiency = player_stats['efficiency'].mean() if not player_stats.empty else 0
         st.metric(
             label="Avg Efficiency",
-            value=f"{avg_efficiency:.4f}",
+            value=f"{kpis['avg_efficiency']:.4f}",
             delta=None
         )
 
 
-def display_top_performers(player_stats):
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_top_performers(selected_team):
+    """Load top players, grouped and ranked in SQL (cached across reruns)."""
+    return get_db_connection().get_top_performers(
+        limit=10, team_name=None if selected_team == 'All' else selected_team
+    )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_top_teams(selected_team):
+    """Load team-level totals, aggregated in SQL (cached across reruns)."""
+    return get_db_connection().get_top_teams(
+        limit=10, team_name=None if selected_team == 'All' else selected_team
+    )
+
+
+@st.fragment
+def display_top_performers(selected_team='All'):
     """Display top performing players."""
     st.subheader(" Top Performers")
-    
-    if player_stats.empty:
-        st.info("No player data available yet. Fetch some data to see top performers!")
-        return
-    
-    # Filter out team-level aggregates
-    individual_stats = player_stats[player_stats['player_id'].notna()].copy()
-    
-    if individual_stats.empty:
+
+    # Grouping, ranking and the top-10 cut all happen inside SQLite
+    top_players = _load_top_performers(selected_team)
+
+    if top_players.empty:
         # Show team-level stats if no individual player data
+        team_stats = _load_top_teams(selected_team)
+
+        if team_stats.empty:
+            st.info("No player data available yet. Fetch some data to see top performers!")
+            return
+
         st.info("Individual player stats not available. Showing team-level data:")
-        team_stats = player_stats.groupby('team_name').agg({
-            'goals': 'sum',
-            'assists': 'sum',
-            'minutes_played': 'sum',
-            'efficiency': 'mean'
-        }).reset_index()
-        
-        team_stats = team_stats.sort_values('goals', ascending=False).head(10)
         team_stats.columns = ['Team', 'Goals', 'Assists', 'Minutes', 'Avg Efficiency']
         st.dataframe(
             team_stats,
@@ -190,18 +288,9 @@ def display_top_performers(player_stats):
             hide_index=True
         )
         return
-    
-    # Aggregate by player
-    top_players = individual_stats.groupby(['player_name', 'team_name']).agg({
-        'goals': 'sum',
-        'assists': 'sum',
-        'minutes_played': 'sum',
-        'efficiency': 'mean'
-    }).reset_index()
-    
-    top_players = top_players.sort_values('goals', ascending=False).head(10)
+
     top_players.columns = ['Player', 'Team', 'Goals', 'Assists', 'Minutes', 'Avg Efficiency']
-    
+
     st.dataframe(
         top_players,
         use_container_width=True,
@@ -209,167 +298,193 @@ def display_top_performers(player_stats):
     )
 
 
-def display_performance_scatter(player_stats):
-    """Display goals vs assists scatter plot."""
-    st.subheader(" Performance Overview: Goals vs Assists")
-    
+@st.cache_data(ttl=600, show_spinner=False)
+def _aggregate_player_stats(player_stats):
+    """
+    Aggregate stats per player once, shared by the scatter and workload
+    views instead of each re-running the same groupby per rerun.
+    """
     if player_stats.empty:
-        st.info("No data available for visualization.")
-        return
-    
-    # Aggregate by player
-    perf_data = player_stats.groupby(['player_name', 'team_name']).agg({
-        'goals': 'sum',
-        'assists': 'sum',
-        'minutes_played': 'sum'
-    }).reset_index()
-    
-    if perf_data.empty or len(perf_data) < 2:
-        st.info("Insufficient data for scatter plot.")
-        return
-    
-    fig = px.scatter(
-        perf_data,
-        x='goals',
-        y='assists',
-        size='minutes_played',
-        hover_data=['player_name', 'team_name'],
-        title='Player Performance: Goals vs Assists',
-        labels={'goals': 'Total Goals', 'assists': 'Total Assists'},
-        color='team_name',
-        size_max=30
-    )
-    
-    fig.update_layout(
-        height=500,
-        hovermode='closest',
-        showlegend=True
+        return pd.DataFrame()
+    return (
+        player_stats.groupby(['player_name', 'team_name'], sort=False, observed=True)
+        .agg(
+            goals=('goals', 'sum'),
+            assists=('assists', 'sum'),
+            minutes_played=('minutes_played', 'sum'),
+            efficiency=('efficiency', 'mean'),
+        )
+        .reset_index()
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
 
-def display_team_comparison(team_performance):
-    """Display team comparison bar chart."""
-    st.subheader(" Team Comparison")
-    
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_daily_trends():
+    """
+    Load pre-aggregated per-day stats for the trend view.
+
+    The fetch pipeline maintains player_stats_daily, so this reads a
+    table bounded by days rather than re-grouping the stats frame.
+    """
+    daily = get_db_connection().get_daily_trends()
+    if daily.empty:
+        return pd.DataFrame()
+    return daily.rename(columns={
+        'total_goals': 'goals',
+        'total_assists': 'assists',
+        'avg_efficiency': 'efficiency',
+    })
+
+
+def _add_performance_scatter(fig, perf_data, row, col):
+    """Add the goals-vs-assists WebGL scatter to the grid."""
+    if len(perf_data) < 2:
+        return
+
+    # WebGL trace fed with NumPy arrays: the GPU path keeps redraws cheap
+    # where the SVG renderer chokes past a few thousand markers
+    sizes = perf_data['minutes_played'].to_numpy(dtype=float)
+    if sizes.max() > 0:
+        sizes = sizes / sizes.max() * 30
+    sizes = np.clip(sizes, 4, None)
+    team_codes = pd.factorize(perf_data['team_name'])[0]
+
+    fig.add_trace(go.Scattergl(
+        x=perf_data['goals'].to_numpy(),
+        y=perf_data['assists'].to_numpy(),
+        mode='markers',
+        marker=dict(size=sizes, color=team_codes, colorscale='Viridis'),
+        text=perf_data['player_name'],
+        customdata=perf_data['team_name'],
+        hovertemplate='%{text} (%{customdata})<br>Goals: %{x}<br>Assists: %{y}<extra></extra>',
+        showlegend=False
+    ), row=row, col=col)
+    fig.update_xaxes(title_text='Total Goals', row=row, col=col)
+    fig.update_yaxes(title_text='Total Assists', row=row, col=col)
+
+
+def _add_team_comparison(fig, team_performance, row, col):
+    """Add the team-comparison bar chart to the grid."""
     if team_performance.empty:
-        st.info("No team data available yet.")
         return
-    
+
     # Sort by total goals
     team_perf = team_performance.sort_values('total_goals', ascending=False).head(15)
-    
-    fig = px.bar(
-        team_perf,
-        x='team_name',
-        y='total_goals',
-        title='Team Performance: Total Goals',
-        labels={'team_name': 'Team', 'total_goals': 'Total Goals'},
-        color='total_goals',
-        color_continuous_scale='Blues'
-    )
-    
-    fig.update_layout(
-        height=500,
-        xaxis_tickangle=-45,
+
+    fig.add_trace(go.Bar(
+        x=team_perf['team_name'],
+        y=team_perf['total_goals'],
+        marker=dict(color=team_perf['total_goals'], colorscale='Blues'),
         showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    ), row=row, col=col)
+    fig.update_xaxes(title_text='Team', tickangle=-45, row=row, col=col)
+    fig.update_yaxes(title_text='Total Goals', row=row, col=col)
 
 
-def display_trend_analysis(player_stats):
-    """Display performance trend over time."""
-    st.subheader(" Trend Analysis: Performance Over Time")
-    
-    if player_stats.empty or 'created_at' not in player_stats.columns:
-        st.info("No temporal data available for trend analysis.")
+def _add_trend_analysis(fig, daily_stats, row, col):
+    """Add the daily goals/assists trend lines to the grid."""
+    if len(daily_stats) < 2:
         return
-    
-    # Convert created_at to datetime
-    trend_data = player_stats.copy()
-    trend_data['date'] = pd.to_datetime(trend_data['created_at']).dt.date
-    
-    # Aggregate by date
-    daily_stats = trend_data.groupby('date').agg({
-        'goals': 'sum',
-        'assists': 'sum',
-        'efficiency': 'mean'
-    }).reset_index()
-    
-    if daily_stats.empty or len(daily_stats) < 2:
-        st.info("Insufficient temporal data for trend visualization.")
-        return
-    
-    fig = go.Figure()
-    
+
     fig.add_trace(go.Scatter(
         x=daily_stats['date'],
         y=daily_stats['goals'],
         mode='lines+markers',
         name='Goals',
         line=dict(color='#3b82f6', width=3)
-    ))
-    
+    ), row=row, col=col)
+
     fig.add_trace(go.Scatter(
         x=daily_stats['date'],
         y=daily_stats['assists'],
         mode='lines+markers',
         name='Assists',
         line=dict(color='#10b981', width=3)
-    ))
-    
-    fig.update_layout(
-        title='Daily Performance Trends',
-        xaxis_title='Date',
-        yaxis_title='Count',
-        height=500,
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    ), row=row, col=col)
+    fig.update_xaxes(title_text='Date', row=row, col=col)
+    fig.update_yaxes(title_text='Count', row=row, col=col)
 
 
-def display_workload_analysis(player_stats):
-    """Display workload vs performance bubble chart."""
-    st.subheader(" Workload Analysis: Minutes vs Performance")
-    
-    if player_stats.empty:
-        st.info("No data available for workload analysis.")
+def _add_workload_analysis(fig, workload_data, row, col):
+    """Add the workload-vs-efficiency bubble chart to the grid."""
+    if len(workload_data) < 2:
         return
-    
-    # Aggregate by player
-    workload_data = player_stats.groupby(['player_name', 'team_name']).agg({
-        'minutes_played': 'sum',
-        'efficiency': 'mean',
-        'goals': 'sum'
-    }).reset_index()
-    
-    if workload_data.empty or len(workload_data) < 2:
-        st.info("Insufficient data for workload visualization.")
+
+    minutes = workload_data['minutes_played'].to_numpy(dtype=float)
+    efficiency = workload_data['efficiency'].to_numpy(dtype=float)
+    goals = workload_data['goals'].to_numpy(dtype=float)
+    text = workload_data['player_name']
+
+    if len(workload_data) > 5000:
+        # Pre-bin into 200 workload buckets and plot bin means; the shape
+        # of the relationship survives with a constant point count
+        edges = np.linspace(minutes.min(), minutes.max(), 201)
+        bins = np.clip(np.digitize(minutes, edges) - 1, 0, 199)
+        counts = np.bincount(bins, minlength=200)
+        occupied = counts > 0
+        minutes = np.bincount(bins, weights=minutes, minlength=200)[occupied] / counts[occupied]
+        efficiency = np.bincount(bins, weights=efficiency, minlength=200)[occupied] / counts[occupied]
+        goals = np.bincount(bins, weights=goals, minlength=200)[occupied] / counts[occupied]
+        text = [f"{int(c)} players" for c in counts[occupied]]
+
+    # Rebinding below never mutates in place, so no defensive copy needed
+    sizes = goals
+    if sizes.max() > 0:
+        sizes = sizes / sizes.max() * 40
+    sizes = np.clip(sizes, 4, None)
+
+    fig.add_trace(go.Scattergl(
+        x=minutes,
+        y=efficiency,
+        mode='markers',
+        marker=dict(size=sizes, color=goals, colorscale='Blues'),
+        text=text,
+        hovertemplate='%{text}<br>Minutes: %{x:.0f}<br>Efficiency: %{y:.4f}<extra></extra>',
+        showlegend=False
+    ), row=row, col=col)
+    fig.update_xaxes(title_text='Total Minutes Played', row=row, col=col)
+    fig.update_yaxes(title_text='Average Efficiency', row=row, col=col)
+
+
+@st.fragment
+def display_charts(player_agg, daily_agg):
+    """Display the four analysis charts as one 2x2 subplot grid.
+
+    A single figure means one Plotly.js instance and one shared WebGL
+    renderer for the page instead of four, well clear of the browser's
+    WebGL-context cap and with one hover/event loop.
+    """
+    st.subheader(" Performance Analysis")
+
+    if player_agg.empty and daily_agg.empty:
+        st.info("No data available for visualization.")
         return
-    
-    fig = px.scatter(
-        workload_data,
-        x='minutes_played',
-        y='efficiency',
-        size='goals',
-        hover_data=['player_name', 'team_name'],
-        title='Workload vs Efficiency',
-        labels={'minutes_played': 'Total Minutes Played', 'efficiency': 'Average Efficiency'},
-        color='team_name',
-        size_max=40
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=(
+            'Goals vs Assists', 'Team Comparison',
+            'Daily Trends', 'Workload vs Efficiency'
+        )
     )
-    
+
+    _add_performance_scatter(fig, player_agg, row=1, col=1)
+    _add_team_comparison(fig, _load_team_performance(), row=1, col=2)
+    _add_trend_analysis(fig, daily_agg, row=2, col=1)
+    _add_workload_analysis(fig, player_agg, row=2, col=2)
+
     fig.update_layout(
-        height=500,
-        hovermode='closest'
+        height=900,
+        hovermode='closest',
+        # Stable uirevision keeps zoom/pan state and the WebGL context
+        # alive across filter-driven reruns instead of a full redraw
+        uirevision='charts_v1'
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    st.plotly_chart(fig, use_container_width=True, key='chart_grid')
 
 
+@st.fragment
 def display_insights(player_stats, matches, team_performance):
     """Display automated insights."""
     st.subheader(" Key Insights")
@@ -417,17 +532,32 @@ def display_insights(player_stats, matches, team_performance):
         """)
 
 
-def display_sidebar_filters(matches, player_stats):
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_filter_options():
+    """Load distinct team/player filter options from SQL (cached)."""
+    return get_db_connection().get_filter_options()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_match_date_bounds():
+    """Load the min/max match dates for the date picker (cached)."""
+    result = get_db_connection().execute_query(
+        "SELECT MIN(DATE(utc_date)) AS min_date, MAX(DATE(utc_date)) AS max_date FROM matches"
+    )
+    if result.empty or result.iloc[0]['min_date'] is None:
+        return None, None
+    row = result.iloc[0]
+    return pd.to_datetime(row['min_date']).date(), pd.to_datetime(row['max_date']).date()
+
+
+def display_sidebar_filters():
     """Display sidebar filters."""
     st.sidebar.header("Filters")
-    
+
     # Date range filter
     st.sidebar.subheader("Date Range")
-    if not matches.empty and 'utc_date' in matches.columns:
-        matches['utc_date'] = pd.to_datetime(matches['utc_date'])
-        min_date = matches['utc_date'].min().date()
-        max_date = matches['utc_date'].max().date()
-        
+    min_date, max_date = _load_match_date_bounds()
+    if min_date is not None:
         date_range = st.sidebar.date_input(
             "Select date range",
             value=(min_date, max_date),
@@ -437,23 +567,25 @@ def display_sidebar_filters(matches, player_stats):
     else:
         st.sidebar.info("No date data available")
         date_range = None
-    
+
+    # Team/player option lists come from indexed SELECT DISTINCT queries
+    # instead of unique()+sorted() scans over the frame on every rerun
+    options = _load_filter_options()
+
     # Team filter
     st.sidebar.subheader("Team")
-    if not player_stats.empty and 'team_name' in player_stats.columns:
-        teams = ['All'] + sorted(player_stats['team_name'].unique().tolist())
-        selected_team = st.sidebar.selectbox("Select team", teams)
+    if options['teams']:
+        selected_team = st.sidebar.selectbox("Select team", ['All'] + options['teams'])
     else:
         selected_team = 'All'
-    
+
     # Player filter
     st.sidebar.subheader("Player")
-    if not player_stats.empty and 'player_name' in player_stats.columns:
-        players = ['All'] + sorted(player_stats['player_name'].unique().tolist())
-        selected_player = st.sidebar.selectbox("Select player", players)
+    if options['players']:
+        selected_player = st.sidebar.selectbox("Select player", ['All'] + options['players'])
     else:
         selected_player = 'All'
-    
+
     return date_range, selected_team, selected_player
 
 
@@ -478,7 +610,7 @@ def display_data_fetch_section():
                 processor.close()
                 
                 st.sidebar.success(f" Fetched and processed {total_processed} matches!")
-                st.cache_resource.clear()
+                st.cache_data.clear()
                 st.rerun()
             except Exception as e:
                 st.sidebar.error(f" Error fetching data: {str(e)}")
@@ -486,69 +618,52 @@ def display_data_fetch_section():
 
 def main():
     """Main dashboard function."""
+    _inject_css()
+
     # Display header
     display_header()
-    
-    # Load data
-    matches, player_stats, team_performance = load_data()
-    
-    # Sidebar
-    date_range, selected_team, selected_player = display_sidebar_filters(matches, player_stats)
+
+    # Sidebar first, so the selected filters ride along as SQL predicates
+    date_range, selected_team, selected_player = display_sidebar_filters()
     display_data_fetch_section()
-    
-    # Apply filters
-    filtered_stats = player_stats.copy()
-    if selected_team != 'All' and not filtered_stats.empty:
-        filtered_stats = filtered_stats[filtered_stats['team_name'] == selected_team]
-    if selected_player != 'All' and not filtered_stats.empty:
-        filtered_stats = filtered_stats[filtered_stats['player_name'] == selected_player]
-    
+
+    date_from, date_to = None, None
+    if date_range and len(date_range) == 2:
+        date_from, date_to = date_range
+
+    # Load data already filtered in the database; no pandas re-masking
+    matches, filtered_stats, team_performance = load_data(
+        selected_team, selected_player, date_from, date_to
+    )
+
     # Main content
-    st.markdown("---")
-    
-    # KPIs
-    display_kpis(filtered_stats, matches)
-    
-    st.markdown("---")
-    
-    # Top performers
-    display_top_performers(filtered_stats)
-    
-    st.markdown("---")
-    
-    # Visualizations in columns
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        display_performance_scatter(filtered_stats)
-    
-    with col2:
-        display_team_comparison(team_performance)
-    
-    st.markdown("---")
-    
-    # More visualizations
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        display_trend_analysis(filtered_stats)
-    
-    with col4:
-        display_workload_analysis(filtered_stats)
-    
-    st.markdown("---")
+    st.divider()
+
+    # KPIs (aggregated in SQL, not from the row-limited frame)
+    display_kpis(matches, selected_team, selected_player)
+
+    st.divider()
+
+    # Top performers (grouped, sorted and limited in SQL)
+    display_top_performers(selected_team)
+
+    st.divider()
     
+    # Shared aggregates: per-player groupby feeds the player-level charts;
+    # the per-day trend comes straight from the materialized table
+    player_agg = _aggregate_player_stats(filtered_stats)
+    daily_agg = _load_daily_trends()
+
+    # All four charts in one subplot grid, one Plotly.js instance
+    display_charts(player_agg, daily_agg)
+
+    st.divider()
+
     # Insights
     display_insights(filtered_stats, matches, team_performance)
-    
-    # Footer
-    st.markdown("---")
-    st.markdown("""
-        <div style='text-align: center; color: #6b7280; padding: 20px;'>
-            <p> Real-Time Sports Analytics Dashboard | Powered by Football-Data.org API</p>
-            <p>Built with Streamlit, Plotly, and SQLite</p>
-        </div>
-    """, unsafe_allow_html=True)
+
+    # Footer (static fragment, untouched by filter reruns)
+    display_footer()
 
 
 if __name__ == '__main__':
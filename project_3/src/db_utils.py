@@ -10,8 +10,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import pandas as pd
-from sqlalchemy import create_engine, text
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import create_engine, event, text
 
 # Configure logging
 logging.basicConfig(
@@ -46,12 +45,37 @@ class DatabaseManager:
     
     def _create_engine(self):
         """Create SQLAlchemy engine."""
-        return create_engine(
+        # Default QueuePool (not StaticPool): WAL allows concurrent
+        # readers, so parallel dashboard queries each get their own
+        # connection instead of serializing on a single shared one
+        # pool_size matches the scheduler's per-competition fan-out so
+        # worker threads never wait on a checkout; recycling guards
+        # against stale handles on multi-day runs
+        engine = create_engine(
             f'sqlite:///{self.db_path}',
             connect_args={'check_same_thread': False},
-            poolclass=StaticPool,
+            pool_size=8,
+            max_overflow=4,
+            pool_recycle=1800,
             echo=False
         )
+
+        @event.listens_for(engine, 'connect')
+        def set_pragmas(dbapi_conn, connection_record):
+            # WAL lets the dashboard read while the fetcher writes, and
+            # NORMAL syncing halves fsyncs during bulk ingest
+            cursor = dbapi_conn.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            # mmap the database file and widen the page cache (64 MB) so
+            # the dashboard's repeated scans read from the OS page cache
+            # instead of going through read() syscalls
+            cursor.execute('PRAGMA mmap_size=268435456')
+            cursor.execute('PRAGMA cache_size=-65536')
+            cursor.close()
+
+        return engine
     
     def _initialize_schema(self):
         """Initialize database schema from schema.sql."""
@@ -64,35 +88,44 @@ class DatabaseManager:
         try:
             with open(schema_path, 'r') as f:
                 schema_sql = f.read()
-            
-            # Split into individual statements
-            statements = [s.strip() for s in schema_sql.split(';') if s.strip()]
-            
-            with self.engine.connect() as conn:
-                for statement in statements:
-                    if statement:
-                        conn.execute(text(statement))
-                conn.commit()
-            
+
+            # sqlite3's native multi-statement runner: one C call for the
+            # whole script, and robust to semicolons inside trigger bodies
+            # where splitting on ';' would break
+            conn = self.engine.raw_connection()
+            try:
+                conn.executescript(schema_sql)
+            finally:
+                conn.close()
+
             logger.info("Database schema initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing schema: {e}")
             raise
     
+    # Timestamp columns parsed to datetime64 at load time, so callers never
+    # re-run pd.to_datetime over result frames
+    DATETIME_COLUMNS = ['utc_date', 'created_at', 'updated_at', 'last_updated']
+
     def execute_query(self, query: str, params: Dict = None) -> pd.DataFrame:
         """
         Execute a SELECT query and return results as DataFrame.
-        
+
         Args:
             query: SQL query string
             params: Query parameters
-            
+
         Returns:
-            DataFrame with query results
+            DataFrame with query results (timestamp columns already datetime)
         """
         try:
             with self.engine.connect() as conn:
-                df = pd.read_sql_query(query, conn, params=params)
+                # Arrow-backed dtypes keep strings as contiguous UTF-8
+                # buffers instead of per-row Python objects, so groupby
+                # and filtering hash C strings rather than PyObjects
+                df = pd.read_sql_query(query, conn, params=params,
+                                       parse_dates=self.DATETIME_COLUMNS,
+                                       dtype_backend='pyarrow')
             return df
         except Exception as e:
             logger.error(f"Error executing query: {e}")
@@ -110,48 +143,57 @@ class DatabaseManager:
         """
         try:
             with self.engine.connect() as conn:
-                # Check if match exists
-                existing = conn.execute(
-                    text("SELECT match_id FROM matches WHERE match_id = :match_id"),
-                    {"match_id": match_data['match_id']}
-                ).fetchone()
-                
-                if existing:
-                    # Update existing match
-                    update_query = text("""
-                        UPDATE matches 
-                        SET status = :status,
-                            home_score = :home_score,
-                            away_score = :away_score,
-                            winner = :winner,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE match_id = :match_id
-                    """)
-                    conn.execute(update_query, match_data)
-                    logger.info(f"Updated match {match_data['match_id']}")
-                else:
-                    # Insert new match
-                    insert_query = text("""
-                        INSERT INTO matches (
-                            match_id, utc_date, status, matchday, stage,
-                            competition_id, competition_name, season_start_year,
-                            home_team_id, home_team_name, away_team_id, away_team_name,
-                            home_score, away_score, winner, duration, venue
-                        ) VALUES (
-                            :match_id, :utc_date, :status, :matchday, :stage,
-                            :competition_id, :competition_name, :season_start_year,
-                            :home_team_id, :home_team_name, :away_team_id, :away_team_name,
-                            :home_score, :away_score, :winner, :duration, :venue
-                        )
-                    """)
-                    conn.execute(insert_query, match_data)
-                    logger.info(f"Inserted new match {match_data['match_id']}")
-                
+                conn.execute(self._MATCH_UPSERT, match_data)
                 conn.commit()
                 return match_data['match_id']
         except Exception as e:
             logger.error(f"Error inserting match: {e}")
             raise
+
+    # Single-statement UPSERT: no SELECT pre-check, one round trip per
+    # record (SQLite >= 3.24)
+    _MATCH_UPSERT = text("""
+        INSERT INTO matches (
+            match_id, utc_date, status, matchday, stage,
+            competition_id, competition_name, season_start_year,
+            home_team_id, home_team_name, away_team_id, away_team_name,
+            home_score, away_score, winner, duration, venue
+        ) VALUES (
+            :match_id, :utc_date, :status, :matchday, :stage,
+            :competition_id, :competition_name, :season_start_year,
+            :home_team_id, :home_team_name, :away_team_id, :away_team_name,
+            :home_score, :away_score, :winner, :duration, :venue
+        )
+        ON CONFLICT(match_id) DO UPDATE SET
+            status = excluded.status,
+            home_score = excluded.home_score,
+            away_score = excluded.away_score,
+            winner = excluded.winner,
+            updated_at = CURRENT_TIMESTAMP
+    """)
+
+    def insert_matches_bulk(self, matches: List[Dict[str, Any]]) -> int:
+        """
+        Upsert many matches in one executemany + one commit.
+
+        Args:
+            matches: List of match dictionaries
+
+        Returns:
+            Number of records upserted
+        """
+        if not matches:
+            return 0
+
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(self._MATCH_UPSERT, matches)
+                conn.commit()
+            logger.info(f"Upserted {len(matches)} matches")
+            return len(matches)
+        except Exception as e:
+            logger.error(f"Error bulk inserting matches: {e}")
+            raise
     
     def insert_player_stats(self, player_stats: List[Dict[str, Any]]) -> int:
         """
@@ -165,17 +207,25 @@ class DatabaseManager:
         """
         if not player_stats:
             return 0
-        
+
         try:
             df = pd.DataFrame(player_stats)
-            records_inserted = df.to_sql(
-                'player_stats',
-                self.engine,
-                if_exists='append',
-                index=False
+            # Bulk-load through the raw sqlite3 connection: executemany
+            # runs the insert loop in C instead of per-row SQLAlchemy calls
+            columns = list(df.columns)
+            placeholders = ', '.join('?' * len(columns))
+            insert_sql = (
+                f"INSERT INTO player_stats ({', '.join(columns)}) "
+                f"VALUES ({placeholders})"
             )
+            conn = self.engine.raw_connection()
+            try:
+                conn.executemany(insert_sql, df.itertuples(index=False, name=None))
+                conn.commit()
+            finally:
+                conn.close()
             logger.info(f"Inserted {len(player_stats)} player stat records")
-            return records_inserted
+            return len(player_stats)
         except Exception as e:
             logger.error(f"Error inserting player stats: {e}")
             raise
@@ -192,45 +242,234 @@ class DatabaseManager:
         """
         try:
             with self.engine.connect() as conn:
-                # Check if team exists
-                existing = conn.execute(
-                    text("SELECT team_id FROM teams WHERE team_id = :team_id"),
-                    {"team_id": team_data['team_id']}
-                ).fetchone()
-                
-                if existing:
-                    # Update existing team
-                    update_query = text("""
-                        UPDATE teams 
-                        SET team_name = :team_name,
-                            short_name = :short_name,
-                            tla = :tla,
-                            crest_url = :crest_url,
-                            founded = :founded,
-                            venue = :venue,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE team_id = :team_id
-                    """)
-                    conn.execute(update_query, team_data)
-                else:
-                    # Insert new team
-                    insert_query = text("""
-                        INSERT INTO teams (
-                            team_id, team_name, short_name, tla, 
-                            crest_url, founded, venue
-                        ) VALUES (
-                            :team_id, :team_name, :short_name, :tla,
-                            :crest_url, :founded, :venue
-                        )
-                    """)
-                    conn.execute(insert_query, team_data)
-                
+                conn.execute(self._TEAM_UPSERT, team_data)
                 conn.commit()
                 return team_data['team_id']
         except Exception as e:
             logger.error(f"Error inserting team: {e}")
             raise
+
+    _TEAM_UPSERT = text("""
+        INSERT INTO teams (
+            team_id, team_name, short_name, tla,
+            crest_url, founded, venue
+        ) VALUES (
+            :team_id, :team_name, :short_name, :tla,
+            :crest_url, :founded, :venue
+        )
+        ON CONFLICT(team_id) DO UPDATE SET
+            team_name = excluded.team_name,
+            short_name = excluded.short_name,
+            tla = excluded.tla,
+            crest_url = excluded.crest_url,
+            founded = excluded.founded,
+            venue = excluded.venue,
+            updated_at = CURRENT_TIMESTAMP
+    """)
     
+    def insert_teams_bulk(self, teams: List[Dict[str, Any]]) -> int:
+        """
+        Upsert many teams in one executemany + one commit.
+
+        Args:
+            teams: List of team dictionaries
+
+        Returns:
+            Number of records upserted
+        """
+        if not teams:
+            return 0
+
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(self._TEAM_UPSERT, teams)
+                conn.commit()
+            logger.info(f"Upserted {len(teams)} teams")
+            return len(teams)
+        except Exception as e:
+            logger.error(f"Error bulk inserting teams: {e}")
+            raise
+
+    def get_kpi_summary(self, team_name: str = None, player_name: str = None) -> Dict[str, Any]:
+        """
+        Compute dashboard KPI totals inside SQLite.
+
+        A single aggregate query returns the scalars instead of shipping
+        thousands of player_stats rows into pandas just to sum them.
+
+        Args:
+            team_name: Optional team filter
+            player_name: Optional player filter
+
+        Returns:
+            Dict with total_goals, total_assists and avg_efficiency
+        """
+        query = """
+            SELECT
+                COALESCE(SUM(goals), 0) AS total_goals,
+                COALESCE(SUM(assists), 0) AS total_assists,
+                COALESCE(AVG(efficiency), 0) AS avg_efficiency
+            FROM player_stats
+        """
+        conditions = []
+        params = {}
+        if team_name:
+            conditions.append("team_name = :team_name")
+            params['team_name'] = team_name
+        if player_name:
+            conditions.append("player_name = :player_name")
+            params['player_name'] = player_name
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        result = self.execute_query(query, params or None)
+        if result.empty:
+            return {'total_goals': 0, 'total_assists': 0, 'avg_efficiency': 0.0}
+        return result.iloc[0].to_dict()
+
+    def get_top_performers(self, limit: int = 10, team_name: str = None) -> pd.DataFrame:
+        """
+        Get top scoring players, aggregated and ranked inside SQLite.
+
+        Args:
+            limit: Number of players to return
+            team_name: Optional team filter
+
+        Returns:
+            DataFrame with per-player totals ordered by goals
+        """
+        query = """
+            SELECT
+                player_name,
+                team_name,
+                SUM(goals) AS goals,
+                SUM(assists) AS assists,
+                SUM(minutes_played) AS minutes_played,
+                AVG(efficiency) AS efficiency
+            FROM player_stats
+            WHERE player_id IS NOT NULL
+        """
+        params = {'limit': limit}
+        if team_name:
+            query += " AND team_name = :team_name"
+            params['team_name'] = team_name
+        query += """
+            GROUP BY player_name, team_name
+            ORDER BY goals DESC
+            LIMIT :limit
+        """
+        return self.execute_query(query, params)
+
+    def get_top_teams(self, limit: int = 10, team_name: str = None) -> pd.DataFrame:
+        """
+        Get team-level totals (fallback when no individual player stats exist).
+
+        Args:
+            limit: Number of teams to return
+            team_name: Optional team filter
+
+        Returns:
+            DataFrame with per-team totals ordered by goals
+        """
+        query = """
+            SELECT
+                team_name,
+                SUM(goals) AS goals,
+                SUM(assists) AS assists,
+                SUM(minutes_played) AS minutes_played,
+                AVG(efficiency) AS efficiency
+            FROM player_stats
+        """
+        params = {'limit': limit}
+        if team_name:
+            query += " WHERE team_name = :team_name"
+            params['team_name'] = team_name
+        query += """
+            GROUP BY team_name
+            ORDER BY goals DESC
+            LIMIT :limit
+        """
+        return self.execute_query(query, params)
+
+    def get_filter_options(self) -> Dict[str, List[str]]:
+        """
+        Get distinct team and player names for the dashboard filters.
+
+        SQLite resolves the DISTINCT against the name indexes, so this stays
+        cheap as player_stats grows.
+
+        Returns:
+            Dict with sorted 'teams' and 'players' name lists
+        """
+        teams = self.execute_query(
+            "SELECT DISTINCT team_name FROM player_stats ORDER BY team_name"
+        )
+        players = self.execute_query(
+            "SELECT DISTINCT player_name FROM player_stats ORDER BY player_name"
+        )
+        return {
+            'teams': teams['team_name'].tolist() if not teams.empty else [],
+            'players': players['player_name'].tolist() if not players.empty else [],
+        }
+
+    def refresh_daily_trends(self) -> None:
+        """
+        Rebuild the player_stats_daily aggregate table.
+
+        Called from the fetch pipeline after ingest so trend queries read
+        a table bounded by the number of days, not player_stats rows.
+        """
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("""
+                    INSERT OR REPLACE INTO player_stats_daily
+                    SELECT
+                        DATE(created_at),
+                        SUM(goals),
+                        SUM(assists),
+                        AVG(efficiency)
+                    FROM player_stats
+                    GROUP BY DATE(created_at)
+                """))
+                conn.commit()
+            logger.info("Refreshed daily trend aggregates")
+        except Exception as e:
+            logger.error(f"Error refreshing daily trends: {e}")
+            raise
+
+    def refresh_team_performance_cache(self) -> None:
+        """
+        Rebuild the materialized team_performance_cache table.
+
+        Called alongside refresh_daily_trends after ingest; the dashboard
+        then reads a plain table instead of re-running the aggregating
+        view per render. Stale for at most one fetch cycle.
+        """
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("DELETE FROM team_performance_cache"))
+                conn.execute(text(
+                    "INSERT INTO team_performance_cache "
+                    "SELECT * FROM team_performance_summary"
+                ))
+                conn.commit()
+            logger.info("Refreshed team performance cache")
+        except Exception as e:
+            logger.error(f"Error refreshing team performance cache: {e}")
+            raise
+
+    def get_daily_trends(self) -> pd.DataFrame:
+        """
+        Get the pre-aggregated per-day stats for trend analysis.
+
+        Returns:
+            DataFrame with date, total_goals, total_assists, avg_efficiency
+        """
+        return self.execute_query(
+            "SELECT date, total_goals, total_assists, avg_efficiency "
+            "FROM player_stats_daily ORDER BY date"
+        )
+
     def get_recent_matches(self, limit: int = 100) -> pd.DataFrame:
         """Get recent matches."""
         query = "SELECT * FROM recent_matches LIMIT :limit"
@@ -249,15 +488,15 @@ class DatabaseManager:
             return self.execute_query(query)
     
     def get_team_performance(self, team_id: int = None) -> pd.DataFrame:
-        """Get team performance summary."""
+        """Get team performance summary (from the materialized cache)."""
         if team_id:
             query = """
-                SELECT * FROM team_performance_summary 
+                SELECT * FROM team_performance_cache
                 WHERE team_id = :team_id
             """
             return self.execute_query(query, {"team_id": team_id})
         else:
-            query = "SELECT * FROM team_performance_summary"
+            query = "SELECT * FROM team_performance_cache"
             return self.execute_query(query)
     
     def close(self):
@@ -3,15 +3,29 @@ Data fetcher for the Real-Time Sports Analytics System.
 Handles API calls to Football-Data.org and saves responses.
 """
 
+import asyncio
+import gzip
 import os
-import json
 import logging
+import sqlite3
+import threading
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
+import httpx
+import orjson
 import requests
+
+try:
+    # C-accelerated yajl2 backend when available
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +45,36 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def iter_snapshot_matches(path):
+    """
+    Stream matches one at a time from a saved snapshot file.
+
+    Memory stays at one match regardless of snapshot size — full-season
+    files never materialize as a whole tree. Handles the gzipped NDJSON
+    layout (header line, then one match per line) as well as older
+    plain-JSON snapshots via ijson.
+
+    Args:
+        path: Path to a matches snapshot file
+
+    Yields:
+        Match dictionaries
+    """
+    path = str(path)
+    if path.endswith('.jsonl.gz'):
+        with gzip.open(path, 'rb') as f:
+            next(f, None)  # header line
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    elif path.endswith('.json.gz'):
+        with gzip.open(path, 'rb') as f:
+            yield from ijson.items(f, 'matches.item')
+    else:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'matches.item')
+
+
 class FootballDataFetcher:
     """Fetches data from Football-Data.org API."""
     
@@ -46,82 +90,397 @@ class FootballDataFetcher:
         }
         self.snapshot_dir = Path('data/snapshots')
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Rate limiting: 10 requests per minute for free tier
+
+        # One session for all sync requests: keeps the TLS connection
+        # alive between calls and retries transient failures (honouring
+        # Retry-After on 429) instead of hand-rolled sleep loops
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Validator cache for conditional GETs: a 304 costs a couple of
+        # hundred bytes instead of re-downloading an unchanged payload
+        cache_dir = Path('data/cache')
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.http_cache = sqlite3.connect(
+            str(cache_dir / 'http.sqlite'), check_same_thread=False
+        )
+        self.http_cache.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB,
+                fetched_at INTEGER
+            )
+        """)
+        self.http_cache.execute("""
+            CREATE TABLE IF NOT EXISTS teams (
+                team_id INTEGER PRIMARY KEY,
+                body BLOB,
+                fetched_at INTEGER
+            )
+        """)
+        self.http_cache.commit()
+
+        # Teams already seen in matches payloads; saves one rate-limited
+        # request per fetch_team call for known teams
+        self._team_cache: Dict[int, Dict] = {}
+
+        # Competition list changes rarely; memoize it per session so
+        # repeat calls never spend a slot of the 10/min budget
+        self._competitions_cache: Optional[Dict] = None
+        self._competitions_fetched_at = 0.0
+
+        # True when the most recent sync request came back 304, i.e. the
+        # body was served from the validator cache unchanged
+        self.last_not_modified = False
+
+        # Rate limiting: 10 requests per minute for free tier. The lock
+        # makes the sync limiter safe when endpoint methods are called
+        # from worker threads (e.g. the dashboard fetch button while the
+        # scheduler polls).
         self.request_delay = 6  # seconds
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
+        # Token bucket shared by all concurrent coroutines; lets requests
+        # run in parallel while staying inside the free-tier budget
+        self.rate_limiter = AsyncLimiter(10, 60)
     
+    def close(self):
+        """Release the HTTP connection pool and the validator cache."""
+        self.session.close()
+        self.http_cache.close()
+
     def _rate_limit(self):
-        """Implement rate limiting."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Implement rate limiting (thread-safe)."""
+        with self._rate_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+
+            if time_since_last_request < self.request_delay:
+                sleep_time = self.request_delay - time_since_last_request
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+
+            self.last_request_time = time.time()
     
-    def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+    def _make_request(self, endpoint: str, params: Dict = None,
+                      with_bytes: bool = False) -> Optional[Dict]:
         """
         Make API request with error handling.
-        
+
         Args:
             endpoint: API endpoint (without base URL)
             params: Query parameters
-            
+            with_bytes: Also return the raw response bytes, letting
+                callers snapshot them without a decode/re-encode round
+                trip
+
         Returns:
-            JSON response or None if error
+            JSON response (or a (response, raw_bytes) tuple when
+            with_bytes is set); None if error
         """
         self._rate_limit()
-        
+
         url = f"{self.base_url}/{endpoint}"
+        cache_key = self._cache_key(url, params)
+        cached = self.http_cache.execute(
+            "SELECT etag, last_modified, body FROM responses WHERE url = ?",
+            (cache_key,)
+        ).fetchone()
+
+        headers = {}
+        if cached:
+            if cached[0]:
+                headers['If-None-Match'] = cached[0]
+            if cached[1]:
+                headers['If-Modified-Since'] = cached[1]
+
         start_time = time.time()
-        
+
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params,
+                                        headers=headers or None, timeout=30)
             latency = time.time() - start_time
-            
-            if response.status_code == 200:
+
+            if response.status_code == 304 and cached:
+                logger.info(f"NOT MODIFIED: {endpoint} (serving cached body)")
+                self.last_not_modified = True
+                data = orjson.loads(cached[2])
+                return (data, cached[2]) if with_bytes else data
+            elif response.status_code == 200:
                 logger.info(f"SUCCESS: {endpoint} (latency: {latency:.2f}s)")
-                return response.json()
-            elif response.status_code == 429:
-                logger.warning("Rate limit exceeded. Waiting 60 seconds...")
-                time.sleep(60)
-                return self._make_request(endpoint, params)
+                self.last_not_modified = False
+                self._store_cached_response(cache_key, response)
+                # Parse the raw bytes with orjson: skips the str decode
+                # and the slower stdlib parser inside response.json()
+                data = orjson.loads(response.content)
+                return (data, response.content) if with_bytes else data
             else:
+                # 429 and transient 5xx are already retried (with
+                # Retry-After respected) by the session's adapter
                 logger.error(f"ERROR {response.status_code}: {endpoint} - {response.text}")
                 return None
         except requests.exceptions.RequestException as e:
             logger.error(f"REQUEST FAILED: {endpoint} - {str(e)}")
             return None
     
-    def _save_snapshot(self, data: Dict, name: str):
+    TEAM_CACHE_TTL = 24 * 3600  # seconds
+    COMPETITIONS_CACHE_TTL = 3600  # seconds
+
+    def _remember_teams(self, matches_data: Dict):
         """
-        Save API response as timestamped JSON file.
-        
+        Populate the team cache from a matches payload.
+
+        The matches response already carries each side's team subobject,
+        so later fetch_team calls for these IDs never hit the network.
+        """
+        rows = []
+        now = int(time.time())
+        for match in matches_data.get('matches', []):
+            for side in ('homeTeam', 'awayTeam'):
+                team = match.get(side)
+                if team and team.get('id') is not None:
+                    self._team_cache[team['id']] = team
+                    rows.append((team['id'], orjson.dumps(team), now))
+        if rows:
+            self.http_cache.executemany(
+                "INSERT OR REPLACE INTO teams VALUES (?, ?, ?)", rows
+            )
+            self.http_cache.commit()
+
+    def _cached_team(self, team_id: int) -> Optional[Dict]:
+        """Look up a team in memory, then in the on-disk cache."""
+        team = self._team_cache.get(team_id)
+        if team is not None:
+            return team
+
+        row = self.http_cache.execute(
+            "SELECT body, fetched_at FROM teams WHERE team_id = ?", (team_id,)
+        ).fetchone()
+        if row and time.time() - row[1] < self.TEAM_CACHE_TTL:
+            team = orjson.loads(row[0])
+            self._team_cache[team_id] = team
+            return team
+        return None
+
+    @staticmethod
+    def _cache_key(url: str, params: Dict = None) -> str:
+        """Build a stable cache key from the URL and sorted params."""
+        if not params:
+            return url
+        query = '&'.join(f'{k}={params[k]}' for k in sorted(params))
+        return f'{url}?{query}'
+
+    def _store_cached_response(self, cache_key: str, response):
+        """Remember the response body and validators for conditional GETs."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        self.http_cache.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (cache_key, etag, last_modified, response.content, int(time.time()))
+        )
+        self.http_cache.commit()
+
+    async def _make_request_async(self, client: httpx.AsyncClient, endpoint: str,
+                                  params: Dict = None,
+                                  max_retries: int = 5,
+                                  with_bytes: bool = False) -> Optional[Dict]:
+        """
+        Make an API request on a shared async client.
+
+        Retries iteratively: 429 sleeps for the server's Retry-After
+        (capped exponential fallback when absent) and 5xx backs off
+        exponentially, so sustained throttling never grows the stack or
+        oversleeps a short retry window.
+
+        Args:
+            client: Shared httpx client (reuses the connection pool)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            max_retries: Attempts before giving up
+
+        Returns:
+            JSON response or None if error
+        """
+        url = f"{self.base_url}/{endpoint}"
+
+        for attempt in range(max_retries):
+            async with self.rate_limiter:
+                start_time = time.time()
+                try:
+                    response = await client.get(url, params=params)
+                except httpx.HTTPError as e:
+                    logger.error(f"REQUEST FAILED: {endpoint} - {str(e)}")
+                    return None
+                latency = time.time() - start_time
+
+            if response.status_code == 200:
+                logger.info(f"SUCCESS: {endpoint} (latency: {latency:.2f}s)")
+                data = orjson.loads(response.content)
+                return (data, response.content) if with_bytes else data
+            elif response.status_code == 429:
+                retry_after = response.headers.get('Retry-After', '')
+                delay = int(retry_after) if retry_after.isdigit() else min(60, 2 ** attempt * 5)
+                logger.warning(f"Rate limited on {endpoint}; retrying in {delay}s")
+                await asyncio.sleep(delay)
+            elif response.status_code >= 500:
+                delay = min(30, 2 ** attempt)
+                logger.warning(f"Server error {response.status_code} on {endpoint}; "
+                               f"retrying in {delay}s")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"ERROR {response.status_code}: {endpoint} - {response.text}")
+                return None
+
+        logger.error(f"Giving up on {endpoint} after {max_retries} attempts")
+        return None
+
+    def _stream_request(self, endpoint: str, params: Dict = None,
+                        json_path: str = ''):
+        """
+        Stream items from an endpoint without materializing the response.
+
+        The response body feeds ijson directly off the socket, so peak
+        memory stays at one item instead of the raw bytes plus the whole
+        parsed tree. The context manager returns the connection to the
+        session pool when the generator closes.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json_path: ijson item path to iterate (e.g. 'matches.item')
+
+        Yields:
+            Parsed items at json_path
+        """
+        self._rate_limit()
+
+        url = f"{self.base_url}/{endpoint}"
+        try:
+            with self.session.get(url, params=params, timeout=30,
+                                  stream=True) as response:
+                if response.status_code != 200:
+                    logger.error(f"ERROR {response.status_code}: {endpoint}")
+                    return
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, json_path)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"REQUEST FAILED: {endpoint} - {str(e)}")
+
+    def iter_standings_rows(self, competition_code: str):
+        """
+        Stream league-table rows for a competition one dict at a time.
+
+        Args:
+            competition_code: Competition code (e.g., 'PL', 'CL')
+
+        Yields:
+            Table-row dictionaries across all standings groups
+        """
+        logger.info(f"Streaming standings for {competition_code}...")
+        yield from self._stream_request(
+            f'competitions/{competition_code}/standings',
+            json_path='standings.item.table.item'
+        )
+
+    def _save_snapshot(self, data: Dict, name: str, *, compact: bool = True,
+                       timestamp: str = None):
+        """
+        Save API response as a timestamped snapshot.
+
+        Compact snapshots (the default) are gzipped compact JSON; match
+        payloads are written as NDJSON — a header line followed by one
+        match per line — so downstream readers can stream them line by
+        line. compact=False keeps a pretty-printed .json for eyeballing.
+
         Args:
             data: Response data to save
             name: Base name for the file
+            compact: Write gzipped machine-oriented output
+            timestamp: Shared batch timestamp (computed once per batch
+                instead of per file)
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{name}_{timestamp}.json"
-        filepath = self.snapshot_dir / filename
-        
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self._write_snapshot(data, name, compact, timestamp)
+
+    def _save_snapshot_bytes(self, raw: bytes, name: str, *,
+                             timestamp: str = None):
+        """
+        Save raw response bytes as a gzipped snapshot.
+
+        The API already handed us valid JSON bytes, so there is nothing
+        to gain from decoding and re-encoding them before writing.
+
+        Args:
+            raw: Raw JSON bytes from the response
+            name: Base name for the file
+            timestamp: Shared batch timestamp
+        """
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filepath = self.snapshot_dir / f"{name}_{timestamp}.json.gz"
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with gzip.open(filepath, 'wb', compresslevel=3) as f:
+                f.write(raw)
+            logger.info(f"Snapshot saved: {filepath}")
+        except Exception as e:
+            logger.error(f"Error saving snapshot: {e}")
+
+    def _write_snapshot(self, data: Dict, name: str, compact: bool,
+                        timestamp: str):
+        """Encode and write one snapshot file (see _save_snapshot)."""
+        try:
+            if not compact:
+                filepath = self.snapshot_dir / f"{name}_{timestamp}.json"
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            elif isinstance(data, dict) and 'matches' in data:
+                filepath = self.snapshot_dir / f"{name}_{timestamp}.jsonl.gz"
+                header = {k: v for k, v in data.items() if k != 'matches'}
+                with gzip.open(filepath, 'wb', compresslevel=3) as f:
+                    f.write(orjson.dumps(header))
+                    f.write(b'\n')
+                    for match in data['matches']:
+                        f.write(orjson.dumps(match))
+                        f.write(b'\n')
+            else:
+                filepath = self.snapshot_dir / f"{name}_{timestamp}.json.gz"
+                with gzip.open(filepath, 'wb', compresslevel=3) as f:
+                    f.write(orjson.dumps(data))
             logger.info(f"Snapshot saved: {filepath}")
         except Exception as e:
             logger.error(f"Error saving snapshot: {e}")
     
     def fetch_competitions(self) -> Optional[Dict]:
-        """Fetch available competitions."""
+        """Fetch available competitions (memoized per session)."""
+        if (self._competitions_cache is not None and
+                time.time() - self._competitions_fetched_at < self.COMPETITIONS_CACHE_TTL):
+            logger.debug("Competitions served from cache")
+            return self._competitions_cache
+
         logger.info("Fetching competitions...")
-        data = self._make_request('competitions')
-        if data:
-            self._save_snapshot(data, 'competitions')
+        result = self._make_request('competitions', with_bytes=True)
+        if not result:
+            return None
+        data, raw = result
+        self._save_snapshot_bytes(raw, 'competitions')
+        self._competitions_cache = data
+        self._competitions_fetched_at = time.time()
         return data
     
     def fetch_matches(self, competition_code: str = None, 
@@ -159,6 +518,7 @@ class FootballDataFetcher:
         if data:
             snapshot_name = f'matches_{competition_code}' if competition_code else 'matches_all'
             self._save_snapshot(data, snapshot_name)
+            self._remember_teams(data)
         return data
     
     def fetch_team(self, team_id: int) -> Optional[Dict]:
@@ -171,10 +531,25 @@ class FootballDataFetcher:
         Returns:
             Team data
         """
+        cached = self._cached_team(team_id)
+        if cached is not None:
+            logger.debug(f"Team {team_id} served from cache")
+            return cached
+
         logger.info(f"Fetching team {team_id}...")
-        data = self._make_request(f'teams/{team_id}')
-        if data:
-            self._save_snapshot(data, f'team_{team_id}')
+        result = self._make_request(f'teams/{team_id}', with_bytes=True)
+        if not result:
+            return None
+        data, raw = result
+        self._save_snapshot_bytes(raw, f'team_{team_id}')
+        # Remember the result so a repeat fetch_team(team_id) this
+        # session (or within the TTL) is free
+        self._team_cache[team_id] = data
+        self.http_cache.execute(
+            "INSERT OR REPLACE INTO teams VALUES (?, ?, ?)",
+            (team_id, raw, int(time.time()))
+        )
+        self.http_cache.commit()
         return data
     
     def fetch_team_matches(self, team_id: int, 
@@ -198,9 +573,12 @@ class FootballDataFetcher:
             params['dateTo'] = date_to
         
         logger.info(f"Fetching matches for team {team_id}...")
-        data = self._make_request(f'teams/{team_id}/matches', params)
-        if data:
-            self._save_snapshot(data, f'team_{team_id}_matches')
+        result = self._make_request(f'teams/{team_id}/matches', params,
+                                    with_bytes=True)
+        if not result:
+            return None
+        data, raw = result
+        self._save_snapshot_bytes(raw, f'team_{team_id}_matches')
         return data
     
     def fetch_competition_standings(self, competition_code: str) -> Optional[Dict]:
@@ -214,9 +592,12 @@ class FootballDataFetcher:
             Standings data
         """
         logger.info(f"Fetching standings for {competition_code}...")
-        data = self._make_request(f'competitions/{competition_code}/standings')
-        if data:
-            self._save_snapshot(data, f'standings_{competition_code}')
+        result = self._make_request(f'competitions/{competition_code}/standings',
+                                    with_bytes=True)
+        if not result:
+            return None
+        data, raw = result
+        self._save_snapshot_bytes(raw, f'standings_{competition_code}')
         return data
     
     def fetch_competition_scorers(self, competition_code: str, limit: int = 20) -> Optional[Dict]:
@@ -232,29 +613,100 @@ class FootballDataFetcher:
         """
         logger.info(f"Fetching top scorers for {competition_code}...")
         params = {'limit': limit}
-        data = self._make_request(f'competitions/{competition_code}/scorers', params)
-        if data:
-            self._save_snapshot(data, f'scorers_{competition_code}')
+        result = self._make_request(f'competitions/{competition_code}/scorers',
+                                    params, with_bytes=True)
+        if not result:
+            return None
+        data, raw = result
+        self._save_snapshot_bytes(raw, f'scorers_{competition_code}')
         return data
     
+    async def _fetch_competition_async(self, client: httpx.AsyncClient,
+                                       competition_code: str,
+                                       date_from: str, date_to: str,
+                                       timestamp: str = None):
+        """
+        Fetch matches, standings and scorers for one competition.
+
+        The three endpoints are independent, so they run concurrently
+        under the shared rate limiter.
+        """
+        matches, standings_result, scorers_result = await asyncio.gather(
+            self._make_request_async(
+                client, f'competitions/{competition_code}/matches',
+                {'dateFrom': date_from, 'dateTo': date_to}
+            ),
+            self._make_request_async(
+                client, f'competitions/{competition_code}/standings',
+                with_bytes=True
+            ),
+            self._make_request_async(
+                client, f'competitions/{competition_code}/scorers', {'limit': 20},
+                with_bytes=True
+            ),
+        )
+
+        # Matches go through the NDJSON writer (needs the parsed list);
+        # standings/scorers snapshot their raw bytes with no re-encode
+        if matches:
+            self._save_snapshot(matches, f'matches_{competition_code}',
+                                timestamp=timestamp)
+            self._remember_teams(matches)
+
+        standings = scorers = None
+        if standings_result:
+            standings, raw = standings_result
+            self._save_snapshot_bytes(raw, f'standings_{competition_code}',
+                                      timestamp=timestamp)
+        if scorers_result:
+            scorers, raw = scorers_result
+            self._save_snapshot_bytes(raw, f'scorers_{competition_code}',
+                                      timestamp=timestamp)
+
+        return competition_code, matches, standings, scorers
+
+    async def _fetch_recent_data_async(self, competitions: List[str],
+                                       date_from: str, date_to: str,
+                                       timestamp: str = None):
+        """Fetch all competitions over one shared connection pool."""
+        # HTTP/2 multiplexes every request over one TLS session, so each
+        # call's round-trip hides under the next token-bucket wait
+        # instead of adding its own RTT
+        limits = httpx.Limits(max_keepalive_connections=1, max_connections=4)
+        async with httpx.AsyncClient(headers=self.headers, timeout=30,
+                                     http2=True, limits=limits) as client:
+            return await asyncio.gather(*[
+                self._fetch_competition_async(client, comp, date_from, date_to,
+                                              timestamp)
+                for comp in competitions
+            ])
+
     def fetch_recent_data(self, competitions: List[str] = None, days: int = 7) -> Dict[str, Any]:
         """
         Fetch recent data for specified competitions.
-        
+
+        All endpoints across all competitions are fetched concurrently on
+        one async client; the token-bucket limiter keeps the aggregate
+        request rate inside the free tier, so wall-clock time is bounded
+        by the rate budget rather than the sum of serial request delays.
+
         Args:
             competitions: List of competition codes
             days: Number of days to look back
-            
+
         Returns:
             Dictionary with all fetched data
         """
         if competitions is None:
             competitions_str = os.getenv('DEFAULT_COMPETITIONS', 'PL,CL')
             competitions = [c.strip() for c in competitions_str.split(',')]
-        
-        date_from = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        date_to = datetime.now().strftime('%Y-%m-%d')
-        
+
+        # One clock read for the date window and the shared snapshot stamp
+        now = datetime.now()
+        date_from = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+        date_to = now.strftime('%Y-%m-%d')
+        batch_ts = now.strftime('%Y%m%d_%H%M%S')
+
         results = {
             'competitions': competitions,
             'date_range': {'from': date_from, 'to': date_to},
@@ -262,31 +714,91 @@ class FootballDataFetcher:
             'standings': {},
             'scorers': {}
         }
-        
-        for comp in competitions:
-            logger.info(f"\n{'='*50}")
-            logger.info(f"Processing competition: {comp}")
-            logger.info(f"{'='*50}")
-            
-            # Fetch matches
-            matches_data = self.fetch_matches(comp, date_from, date_to)
+
+        logger.info(f"Fetching {len(competitions)} competitions concurrently...")
+        fetched = asyncio.run(
+            self._fetch_recent_data_async(competitions, date_from, date_to,
+                                          batch_ts)
+        )
+
+        for comp, matches_data, standings_data, scorers_data in fetched:
             if matches_data:
                 results['matches'][comp] = matches_data
-            
-            # Fetch standings
-            standings_data = self.fetch_competition_standings(comp)
             if standings_data:
                 results['standings'][comp] = standings_data
-            
-            # Fetch top scorers
-            scorers_data = self.fetch_competition_scorers(comp)
             if scorers_data:
                 results['scorers'][comp] = scorers_data
-        
+
         logger.info(f"\n{'='*50}")
         logger.info("Data fetch completed")
         logger.info(f"{'='*50}\n")
-        
+
+        return results
+
+    def fetch_recent_data_batched(self, competitions: List[str] = None,
+                                  days: int = 7) -> Dict[str, Any]:
+        """
+        Fetch recent matches for all competitions in one request.
+
+        The cross-competition /matches endpoint accepts a comma-separated
+        competitions filter, so the whole window arrives in a single
+        round-trip (one slot of the rate budget) instead of one call per
+        competition. The payload is bucketed by competition code into the
+        same results shape fetch_recent_data returns; standings and
+        scorers are not part of this endpoint, so their sections stay
+        empty on the batched path.
+
+        Args:
+            competitions: List of competition codes
+            days: Number of days to look back
+
+        Returns:
+            Dictionary with matches keyed by competition code
+        """
+        if competitions is None:
+            competitions_str = os.getenv('DEFAULT_COMPETITIONS', 'PL,CL')
+            competitions = [c.strip() for c in competitions_str.split(',')]
+
+        now = datetime.now()
+        date_from = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+        date_to = now.strftime('%Y-%m-%d')
+
+        results = {
+            'competitions': competitions,
+            'date_range': {'from': date_from, 'to': date_to},
+            'matches': {},
+            'standings': {},
+            'scorers': {}
+        }
+
+        logger.info(f"Fetching {len(competitions)} competitions in one request...")
+        data = self._make_request('matches', {
+            'competitions': ','.join(competitions),
+            'dateFrom': date_from,
+            'dateTo': date_to,
+        })
+        if not data:
+            # _make_request already logged the error; flag the failure
+            # so callers can tell an outage from an empty window
+            results['failed'] = True
+            return results
+
+        # Let callers skip reprocessing when the window came back 304
+        results['not_modified'] = self.last_not_modified
+
+        self._save_snapshot(data, 'matches_all')
+        self._remember_teams(data)
+
+        buckets: Dict[str, List[Dict]] = {}
+        for match in data.get('matches', []):
+            code = (match.get('competition') or {}).get('code')
+            if code:
+                buckets.setdefault(code, []).append(match)
+        for code, matches in buckets.items():
+            results['matches'][code] = {'matches': matches}
+
+        logger.info(f"Fetched {sum(len(m) for m in buckets.values())} matches "
+                    f"across {len(buckets)} competitions in one call")
         return results
 
 
@@ -3,12 +3,18 @@ Scheduler for automated data fetching.
 Fetches data at specified intervals and processes it.
 """
 
+import asyncio
+import gc
 import os
+import queue
+import signal
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any
 from datetime import datetime
 from pathlib import Path
-import schedule
 from dotenv import load_dotenv
 
 from fetch_data import FootballDataFetcher
@@ -21,16 +27,32 @@ load_dotenv()
 log_dir = Path('data/logs')
 log_dir.mkdir(parents=True, exist_ok=True)
 
+# Log records go onto an in-process queue; a background listener owns
+# the file and stream handlers, so disk writes never block the
+# scheduler thread. The rotating file handler caps scheduler.log growth
+# over multi-day runs.
+_log_queue = queue.Queue(-1)
+_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler(
+    os.getenv('LOG_FILE', 'data/logs/scheduler.log'),
+    maxBytes=10_000_000, backupCount=5
+)
+_file_handler.setFormatter(_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_formatter)
+
 logging.basicConfig(
     level=os.getenv('LOG_LEVEL', 'INFO'),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.getenv('LOG_FILE', 'data/logs/scheduler.log')),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler,
+                              respect_handler_level=True)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# Banner separator built once at import instead of per log call
+_SEP = "=" * 70
+
 
 class DataScheduler:
     """Scheduler for automated data fetching and processing."""
@@ -48,42 +70,128 @@ class DataScheduler:
         self.interval_minutes = interval_minutes
         self.fetcher = FootballDataFetcher()
         self.processor = DataProcessor()
-        
+
+        # Consecutive failed ticks; drives exponential backoff in the
+        # run loop so a sustained outage isn't hammered every interval
+        self._fail_count = 0
+
+        # Highest lastUpdated seen per competition; ticks only reprocess
+        # matches the API has touched since (ISO timestamps compare
+        # lexicographically). Reset on restart, so the first tick after
+        # a restart ingests the full window once.
+        self._watermarks: Dict[str, str] = {}
+
         logger.info(f"Scheduler initialized with {interval_minutes} minute interval")
+
+    def _new_matches(self, comp: str, matches_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return matches_data narrowed to matches past the watermark."""
+        watermark = self._watermarks.get(comp, '')
+        fresh = [m for m in matches_data.get('matches', [])
+                 if (m.get('lastUpdated') or '') > watermark]
+        return dict(matches_data, matches=fresh)
+
+    def _advance_watermark(self, comp: str, matches_data: Dict[str, Any]):
+        """Move the competition's watermark past the processed matches."""
+        latest = max((m.get('lastUpdated') or ''
+                      for m in matches_data.get('matches', [])), default='')
+        if latest:
+            self._watermarks[comp] = max(self._watermarks.get(comp, ''), latest)
     
+    def _note_success(self):
+        """Reset the failure counter after any successful fetch."""
+        if self._fail_count:
+            logger.warning("API recovered after %d failed ticks",
+                           self._fail_count)
+            self._fail_count = 0
+
     def fetch_and_process(self):
         """Fetch data from API and process it."""
         try:
-            logger.info("\n" + "="*70)
-            logger.info(f"Starting scheduled data fetch at {datetime.now()}")
-            logger.info("="*70)
-            
-            start_time = time.time()
+            logger.info("\n" + _SEP)
+            logger.info("Starting scheduled data fetch at %s", datetime.now())
+            logger.info(_SEP)
             
-            # Fetch recent data
-            results = self.fetcher.fetch_recent_data(days=7)
+            # Monotonic timer: immune to NTP steps over long runs
+            start_ns = time.perf_counter_ns()
             
-            # Process and store matches
-            total_processed = 0
+            # Fetch recent data: one batched /matches call covers every
+            # competition, so a tick costs a single request slot
+            results = self.fetcher.fetch_recent_data_batched(days=7)
+
+            # A flagged failure (retry-exhausted 429s, timeouts) comes
+            # back as a normal dict; raise so it counts as a failed tick
+            # and feeds the exponential backoff
+            if results.get('failed'):
+                raise RuntimeError('batched matches fetch returned no data')
+
+            # The matches window came back 304 Not Modified: nothing has
+            # changed since the last tick, so skip reprocessing entirely.
+            # Still a successful fetch, so the backoff resets too.
+            if results.get('not_modified'):
+                logger.info("No changes since last fetch; skipping processing")
+                self._note_success()
+                return
+
+            # Narrow each competition to matches updated since its
+            # watermark; the steady-state tick processes nothing
+            matches_by_comp = {}
             for comp, matches_data in results['matches'].items():
-                count = self.processor.process_and_store_matches(matches_data)
-                total_processed += count
-            
-            # Process scorers data
+                fresh = self._new_matches(comp, matches_data)
+                if fresh['matches']:
+                    matches_by_comp[comp] = fresh
+                else:
+                    logger.info("%s: no matches updated since last tick", comp)
+
+            # Process and store matches; competitions are independent, so
+            # their ingest runs in parallel (pandas/SQLite release the GIL)
+            total_processed = 0
+            if matches_by_comp:
+                workers = min(8, len(matches_by_comp))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(self.processor.process_and_store_matches, m): comp
+                        for comp, m in matches_by_comp.items()
+                    }
+                    for future in as_completed(futures):
+                        comp = futures[future]
+                        total_processed += future.result()
+                        self._advance_watermark(comp, matches_by_comp[comp])
+
+            # Process scorers data (log-only, kept sequential so the
+            # per-competition output doesn't interleave)
             for comp, scorers_data in results['scorers'].items():
                 self.processor.process_scorers_data(scorers_data)
+
+            if total_processed:
+                # Rebuild the columnar warehouse so the analytics
+                # summary aggregations see the rows just ingested
+                self.processor.materialize_parquet()
             
-            elapsed_time = time.time() - start_time
-            
-            logger.info("="*70)
-            logger.info(f" Fetch completed successfully!")
-            logger.info(f"   - Processed: {total_processed} matches")
-            logger.info(f"   - Duration: {elapsed_time:.2f} seconds")
-            logger.info(f"   - Next fetch: {self.interval_minutes} minutes")
-            logger.info("="*70 + "\n")
-            
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+            # Deferred %-formatting: the args are only rendered if INFO
+            # is actually enabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_SEP)
+                logger.info(" Fetch completed successfully!")
+                logger.info("   - Processed: %d matches", total_processed)
+                logger.info("   - Duration: %.2f seconds", elapsed_time)
+                logger.info("   - Next fetch: %d minutes", self.interval_minutes)
+                logger.info(_SEP + "\n")
+
+            self._note_success()
+
         except Exception as e:
-            logger.error(f" Error during scheduled fetch: {e}", exc_info=True)
+            self._fail_count += 1
+            if self._fail_count == 1:
+                logger.warning("Scheduled fetch failing; backing off "
+                               "exponentially until it recovers")
+            logger.error(" Error during scheduled fetch: %s", e, exc_info=True)
+        finally:
+            # Reclaim the tick's JSON payloads and intermediate frames
+            # now instead of letting them age into older generations;
+            # keeps RSS flat on multi-day runs. Gen-1 is cheap (~µs).
+            gc.collect(1)
     
     def run_once(self):
         """Run the fetch job once."""
@@ -91,40 +199,68 @@ class DataScheduler:
         self.fetch_and_process()
         logger.info("One-time fetch completed")
     
+    async def _run_loop(self):
+        """Run ticks until stopped, with a precise asyncio timer between them."""
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        # SIGTERM (systemd/docker stop) and SIGINT finish the in-flight
+        # tick, then fall through to cleanup() instead of dying mid-write
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Not available on this platform (e.g. Windows); Ctrl-C
+                # still lands as KeyboardInterrupt in start()
+                pass
+
+        while not stop.is_set():
+            # The fetch pipeline is synchronous (and spins up its own
+            # event loop internally), so run it off the loop thread
+            await asyncio.to_thread(self.fetch_and_process)
+            # Consecutive failures double the wait (capped at an hour)
+            # so a broken upstream isn't hit every interval
+            wait = min(self.interval_minutes * 60 * (2 ** self._fail_count),
+                       3600)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
     def start(self):
         """Start the scheduler."""
-        logger.info(f"\n{'='*70}")
-        logger.info(" Starting Real-Time Sports Analytics Scheduler")
-        logger.info(f"{'='*70}")
-        logger.info(f"Fetch interval: Every {self.interval_minutes} minutes")
-        logger.info(f"Started at: {datetime.now()}")
-        logger.info(f"{'='*70}\n")
-        
-        # Run immediately on start
-        self.fetch_and_process()
-        
-        # Schedule periodic fetches
-        schedule.every(self.interval_minutes).minutes.do(self.fetch_and_process)
-        
-        # Keep the scheduler running
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n" + _SEP)
+            logger.info(" Starting Real-Time Sports Analytics Scheduler")
+            logger.info(_SEP)
+            logger.info("Fetch interval: Every %d minutes", self.interval_minutes)
+            logger.info("Started at: %s", datetime.now())
+            logger.info(_SEP + "\n")
+
+        # Sleep the full interval in one shot instead of polling a job
+        # queue every second; zero idle wakeups between ticks
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            asyncio.run(self._run_loop())
+            logger.info("\n" + _SEP)
+            logger.info("⏸  Scheduler stopped")
+            logger.info(_SEP + "\n")
         except KeyboardInterrupt:
-            logger.info("\n" + "="*70)
+            logger.info("\n" + _SEP)
             logger.info("⏸  Scheduler stopped by user")
-            logger.info("="*70 + "\n")
+            logger.info(_SEP + "\n")
         except Exception as e:
-            logger.error(f"Scheduler error: {e}", exc_info=True)
+            logger.error("Scheduler error: %s", e, exc_info=True)
         finally:
             self.cleanup()
     
     def cleanup(self):
         """Clean up resources."""
         logger.info("Cleaning up resources...")
+        self.fetcher.close()
         self.processor.close()
         logger.info("Cleanup completed")
+        # Drain and stop the logging listener last so the lines above
+        # still reach the file
+        _log_listener.stop()
 
 
 def main():
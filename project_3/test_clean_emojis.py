@@ -0,0 +1,26 @@
+"""Tests for the emoji stripper. Run with python -m unittest."""
+
+import unittest
+
+from clean_emojis import remove_emojis
+
+
+class RemoveEmojisTests(unittest.TestCase):
+    def test_strips_emoji_codepoints(self):
+        self.assertEqual(remove_emojis('done ✅ \U0001F600!'), 'done  !')
+        self.assertEqual(remove_emojis('watch ⌚ and sun ☀'), 'watch  and sun ')
+
+    def test_keeps_codepoints_between_the_two_ranges(self):
+        # U+2400-25FF (control pictures, box drawing, block elements,
+        # geometric shapes) sit between the two stripped ranges and must
+        # survive untouched
+        text = 'chart ▲ pipe │ block █ shade ░'
+        self.assertEqual(remove_emojis(text), text)
+
+    def test_plain_text_unchanged(self):
+        text = 'no emojis here, just text.'
+        self.assertEqual(remove_emojis(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
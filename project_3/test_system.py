@@ -1,36 +1,44 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+# Import everything once at module scope so the heavy dependencies
+# (pandas, sqlalchemy, requests) are paid for a single time instead of
+# once per test function
+try:
+    from db_utils import get_database_manager
+    from fetch_data import FootballDataFetcher
+    from process_data import DataProcessor
+    from scheduler import DataScheduler
+    IMPORT_ERROR = None
+except Exception as e:
+    IMPORT_ERROR = e
+
+# One shared database handle for every test that touches the DB
+db = get_database_manager() if IMPORT_ERROR is None else None
+
+
 def test_imports():
     """Test all imports work correctly."""
     print("\n Testing imports...")
-    try:
-        from db_utils import get_database_manager
-        from fetch_data import FootballDataFetcher
-        from process_data import DataProcessor
+    if IMPORT_ERROR is None:
         print("    All imports successful")
         return True
-    except Exception as e:
-        print(f"    Import failed: {e}")
-        return False
+    print(f"    Import failed: {IMPORT_ERROR}")
+    return False
 
 
 def test_database():
     """Test database initialization."""
     print("\n Testing database...")
     try:
-        from db_utils import get_database_manager
-        db = get_database_manager()
-        
         # Test basic query
         result = db.execute_query("SELECT COUNT(*) as count FROM matches")
         count = result.iloc[0]['count']
         print(f"    Database working - {count} matches in database")
-        
-        db.close()
         return True
     except Exception as e:
         print(f"    Database test failed: {e}")
@@ -41,15 +49,14 @@ def test_data_processor():
     """Test data processor."""
     print("\n Testing data processor...")
     try:
-        from process_data import DataProcessor
         processor = DataProcessor()
-        
+
         # Test analytics summary
         summary = processor.get_analytics_summary()
         print(f"    Data processor working")
         print(f"      - Total matches: {summary['total_matches']}")
         print(f"      - Total goals: {summary['total_goals']}")
-        
+
         processor.close()
         return True
     except Exception as e:
@@ -61,9 +68,8 @@ def test_fetcher_init():
     """Test fetcher initialization."""
     print("\n Testing data fetcher...")
     try:
-        from fetch_data import FootballDataFetcher
         fetcher = FootballDataFetcher()
-        
+
         print(f"    Data fetcher initialized")
         print(f"      - API base URL: {fetcher.base_url}")
         print(f"      - API key configured: {'Yes' if fetcher.api_key and fetcher.api_key != 'your_api_key_here' else 'No (use .env file)'}")
@@ -77,9 +83,8 @@ def test_scheduler():
     """Test scheduler initialization."""
     print("\n Testing scheduler...")
     try:
-        from scheduler import DataScheduler
         scheduler = DataScheduler(interval_minutes=10)
-        
+
         print(f"    Scheduler initialized")
         print(f"      - Interval: {scheduler.interval_minutes} minutes")
         return True
@@ -94,13 +99,19 @@ def main():
     print(" Real-Time Sports Analytics - System Tests")
     print("="*60)
     
-    results = {
-        'Imports': test_imports(),
-        'Database': test_database(),
-        'Data Processor': test_data_processor(),
-        'Data Fetcher': test_fetcher_init(),
-        'Scheduler': test_scheduler()
-    }
+    tests = [
+        ('Imports', test_imports),
+        ('Database', test_database),
+        ('Data Processor', test_data_processor),
+        ('Data Fetcher', test_fetcher_init),
+        ('Scheduler', test_scheduler),
+    ]
+
+    # The tests share no mutable state, so they run concurrently: total
+    # wall time is the slowest test instead of the sum of all five
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        outcomes = list(executor.map(lambda t: t[1](), tests))
+    results = {name: ok for (name, _), ok in zip(tests, outcomes)}
     
     print("\n" + "="*60)
     print(" Test Results Summary")
@@ -123,6 +134,8 @@ def main():
         print("\n  Some tests failed. Please check the errors above.")
     
     print("")
+    if db is not None:
+        db.close()
     return all_passed
 
 